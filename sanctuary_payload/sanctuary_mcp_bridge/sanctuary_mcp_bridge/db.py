@@ -15,25 +15,45 @@ The database schema consists of two tables:
   ritual name, success flag, outcome description, a JSON representation of
   emotions, notes and the originating model identifier.
 
-The JSON encoding for emotional lists uses standard Python ``json`` library
-and is opaque to the database.  See ``schemas.py`` for the corresponding
-Pydantic models.
+The JSON encoding for emotional lists uses ``orjson`` when available
+(falling back to the standard ``json`` library) and is opaque to the
+database.  See ``schemas.py`` for the corresponding Pydantic models.
 """
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import queue
 import sqlite3
-from contextlib import contextmanager
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .schemas import EmotionIntensity, FamiliarInteraction, RitualOutcome
 
+try:
+    import orjson
+
+    def _json_dumps(obj: object) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    def _json_dumps(obj: object) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _json_loads = json.loads
+
 
 DB_NAME = "sanctuary.db"
 
+# Maximum number of idle connections kept per database file.  Connections
+# beyond this limit are simply closed on release.
+POOL_SIZE = int(os.environ.get("SANCTUARY_DB_POOL_SIZE", "5"))
+
 
 def _get_db_path(db_path: Optional[str] = None) -> Path:
     """Return the absolute path to the database file.
@@ -47,9 +67,170 @@ def _get_db_path(db_path: Optional[str] = None) -> Path:
     return Path(DB_NAME).resolve()
 
 
-@contextmanager
-def get_connection(db_path: Optional[str] = None) -> Iterable[sqlite3.Connection]:
-    """Context manager that yields a SQLite connection and closes it on exit.
+# Idle connections per resolved database path.  A LIFO queue keeps the most
+# recently used connection (and therefore the warmest page cache) on top.
+_POOLS: Dict[Path, "queue.LifoQueue[sqlite3.Connection]"] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Cursors reused per (connection, SQL text) pair.  Executing the same SQL
+# on the same cursor lets sqlite3 reuse the prepared statement instead of
+# parsing and planning it again; the WHERE clauses are built
+# deterministically (one string per filter permutation) to keep the hit
+# rate high.  Entries are purged when their connection is closed.
+_STMT_CACHE: Dict[Tuple[int, str], sqlite3.Cursor] = {}
+
+
+def _exec(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+    """Execute ``sql`` on a cursor cached for this connection/SQL pair."""
+    key = (id(conn), sql)
+    cur = _STMT_CACHE.get(key)
+    if cur is None:
+        cur = conn.cursor()
+        _STMT_CACHE[key] = cur
+    return cur.execute(sql, params)
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    """Close ``conn`` and drop its cached cursors."""
+    cid = id(conn)
+    for key in [k for k in _STMT_CACHE if k[0] == cid]:
+        del _STMT_CACHE[key]
+    conn.close()
+
+
+def _configure(conn: sqlite3.Connection) -> None:
+    """Apply the standard performance PRAGMAs to a new connection.
+
+    * ``journal_mode=WAL`` batches fsyncs and lets readers run while a
+      write is in flight.
+    * ``synchronous=NORMAL`` is durable on commit under WAL except across
+      an OS crash, which is an acceptable trade-off for a local log.
+    * ``temp_store=MEMORY`` keeps sort/aggregate scratch space off disk.
+    * ``mmap_size`` lets SQLite read pages via the OS page cache.
+    * ``busy_timeout`` makes readers wait out a writer's checkpoint
+      instead of failing immediately with SQLITE_BUSY.
+    * ``cache_size`` grows the per-connection page cache to ~20MB.
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-20000")
+
+
+def _new_connection(path: Path) -> sqlite3.Connection:
+    """Open and configure a fresh connection to ``path``.
+
+    The PRAGMAs only need to be applied when a connection is created, not
+    on every checkout, which is why pooled connections are configured here
+    rather than in :func:`get_connection`.
+    """
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    _configure(conn)
+    return conn
+
+
+def _get_pool(path: Path) -> "queue.LifoQueue[sqlite3.Connection]":
+    """Return (creating if needed) the connection pool for ``path``."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(path)
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=POOL_SIZE)
+            _POOLS[path] = pool
+        return pool
+
+
+class _PooledConnection:
+    """Hand-written context manager around a pooled connection.
+
+    A plain ``__enter__``/``__exit__`` class avoids the generator frame
+    that ``contextlib.contextmanager`` allocates on every ``with`` block,
+    which is measurable overhead for a helper entered once per database
+    operation.
+    """
+
+    __slots__ = ("_path", "conn")
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def __enter__(self) -> sqlite3.Connection:
+        pool = _get_pool(self._path)
+        try:
+            self.conn = pool.get_nowait()
+        except queue.Empty:
+            self.conn = _new_connection(self._path)
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            _close_connection(self.conn)
+            return
+        try:
+            _get_pool(self._path).put_nowait(self.conn)
+        except queue.Full:
+            _close_connection(self.conn)
+
+
+class _Writer:
+    """A database file's dedicated write connection plus its guard lock."""
+
+    __slots__ = ("conn", "lock")
+
+    def __init__(self) -> None:
+        self.conn: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+
+
+# One writer per database file.  Under WAL only a single writer can be
+# active anyway, so serializing writes on one long-lived connection avoids
+# both lock contention between throwaway connections and repeated opens.
+_WRITERS: Dict[Path, _Writer] = {}
+
+
+class _WriterConnection:
+    """Context manager that serializes access to the per-path writer."""
+
+    __slots__ = ("_path", "_writer")
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def __enter__(self) -> sqlite3.Connection:
+        with _POOLS_LOCK:
+            writer = _WRITERS.get(self._path)
+            if writer is None:
+                writer = _Writer()
+                _WRITERS[self._path] = writer
+        writer.lock.acquire()
+        if writer.conn is None:
+            writer.conn = _new_connection(self._path)
+        self._writer = writer
+        return writer.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        writer = self._writer
+        try:
+            if exc_type is not None and writer.conn is not None:
+                # Discard the connection on failure; the next write
+                # checkout reconnects with a clean transaction state.
+                _close_connection(writer.conn)
+                writer.conn = None
+        finally:
+            writer.lock.release()
+
+
+def read_connection(db_path: Optional[str] = None) -> _PooledConnection:
+    """Return a context manager yielding a pooled read connection.
+
+    Connections are kept open between calls and reused, avoiding the
+    per-call ``sqlite3.connect``/``close`` cycle that discards SQLite's
+    page cache.  A connection is checked out of the pool on entry and
+    returned on a clean exit; if the body raises, the connection is
+    closed instead of being reused.  Under WAL mode the readers never
+    block the writer and vice versa.
 
     Parameters
     ----------
@@ -57,73 +238,436 @@ def get_connection(db_path: Optional[str] = None) -> Iterable[sqlite3.Connection
         Path to the SQLite database file.  If ``None``, the default
         database name ``sanctuary.db`` is used in the working directory.
 
-    Yields
-    ------
-    sqlite3.Connection
-        An open connection to the SQLite database.
+    Returns
+    -------
+    _PooledConnection
+        A context manager whose ``__enter__`` yields an open connection.
+    """
+    return _PooledConnection(_get_db_path(db_path))
+
+
+def write_connection(db_path: Optional[str] = None) -> _WriterConnection:
+    """Return a context manager yielding the dedicated write connection.
+
+    All writes to a given database file are funnelled through one
+    long-lived connection guarded by a lock, matching WAL's
+    single-writer model.
+
+    Parameters
+    ----------
+    db_path : Optional[str]
+        Path to the SQLite database file.  If ``None``, the default
+        database name ``sanctuary.db`` is used in the working directory.
+
+    Returns
+    -------
+    _WriterConnection
+        A context manager whose ``__enter__`` yields the write connection.
+    """
+    return _WriterConnection(_get_db_path(db_path))
+
+
+# Backwards-compatible alias: historical callers used get_connection for
+# reads and writes alike; reads are the overwhelmingly common case.
+get_connection = read_connection
+
+
+def init_pools(db_path: Optional[str] = None) -> None:
+    """Warm the read pool and writer connection for ``db_path``.
+
+    Opening the connections up front (rather than lazily on first use)
+    moves the connect and PRAGMA cost out of the first request.
     """
     path = _get_db_path(db_path)
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+    with _WriterConnection(path):
+        pass
+    with _PooledConnection(path):
+        pass
+
+
+_CREATE_INTERACTIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS interactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        familiar_id TEXT NOT NULL,
+        interaction_type TEXT NOT NULL,
+        emotions TEXT NOT NULL,
+        notes TEXT,
+        model_id TEXT
+    )
+"""
+
+_CREATE_RITUALS_TABLE = """
+    CREATE TABLE IF NOT EXISTS rituals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        ritual_name TEXT NOT NULL,
+        success INTEGER NOT NULL,
+        outcome_description TEXT,
+        emotions TEXT NOT NULL,
+        notes TEXT,
+        model_id TEXT
+    )
+"""
+
+
+def _timestamp_column_type(cur: sqlite3.Cursor, table: str) -> str:
+    """Return the declared type of a table's ``timestamp`` column."""
+    for row in cur.execute(f"PRAGMA table_info({table})").fetchall():
+        if row[1] == "timestamp":
+            return (row[2] or "").upper()
+    return ""
+
+
+def _migrate_legacy_timestamps(conn: sqlite3.Connection) -> None:
+    """Rebuild tables whose ``timestamp`` column predates integer storage.
+
+    Databases created by earlier versions declared ``timestamp TEXT`` and
+    stored ISO-8601 strings.  Leaving that column in place breaks the
+    current code twice over: TEXT affinity coerces new integer writes
+    into decimal strings, and SQLite orders every TEXT value above every
+    INTEGER, so range predicates and ``ORDER BY timestamp`` silently
+    return wrong results on mixed data.  Since a column's affinity cannot
+    be altered in place, each legacy table is rebuilt once — renamed
+    aside, recreated with the modern schema, and its rows copied back
+    with timestamps rewritten as epoch microseconds.
+
+    Each rebuild runs inside an explicit transaction: the sqlite3 module
+    executes DDL in autocommit, so without the ``BEGIN`` a crash between
+    the rename and the copy would durably leave a populated ``*_legacy``
+    table beside an empty new one.  As a belt-and-braces measure a
+    leftover ``*_legacy`` table (from a crash under a version without
+    the transaction) is detected and the copy resumed from it.
+    """
+    cur = conn.cursor()
+    for table, create_sql in (
+        ("interactions", _CREATE_INTERACTIONS_TABLE),
+        ("rituals", _CREATE_RITUALS_TABLE),
+    ):
+        legacy = f"{table}_legacy"
+        resuming = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (legacy,)
+        ).fetchone() is not None
+        if not resuming and _timestamp_column_type(cur, table) == "INTEGER":
+            continue
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            if not resuming:
+                cur.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+            # IF NOT EXISTS in the DDL also covers a resume that crashed
+            # before the new table was created.
+            cur.execute(create_sql)
+            if resuming:
+                cur.execute(f"DELETE FROM {table}")
+            columns = [row[1] for row in cur.execute(f"PRAGMA table_info({table})").fetchall()]
+            ts_index = columns.index("timestamp")
+            column_list = ", ".join(columns)
+            placeholders = ", ".join("?" * len(columns))
+            converted = []
+            for row in cur.execute(f"SELECT {column_list} FROM {legacy}").fetchall():
+                values = list(row)
+                values[ts_index] = _coerce_stored_timestamp(values[ts_index])
+                converted.append(values)
+            cur.executemany(
+                f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})", converted
+            )
+            cur.execute(f"DROP TABLE {legacy}")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
 
 
-def init_db(db_path: Optional[str] = None) -> None:
-    """Initialise the SQLite database with required tables.
+def init_db(db_path: Optional[str] = None, with_indexes: bool = True) -> None:
+    """Initialise the SQLite database with required tables and indexes.
 
     This function creates the ``interactions`` and ``rituals`` tables if
     they do not already exist.  It is idempotent and can be run multiple
-    times without affecting existing data.
+    times without affecting existing data; databases created before the
+    switch to integer timestamps are migrated in place on first contact.
+
+    Parameters
+    ----------
+    db_path : Optional[str]
+        Optional path to a specific database file.
+    with_indexes : bool
+        Whether to create the query indexes.  Pass ``False`` before a
+        large bulk load (index maintenance per inserted row is slower
+        than building the index once afterwards), then call ``init_db``
+        again with the default to create the indexes.
     """
-    with get_connection(db_path) as conn:
+    with write_connection(db_path) as conn:
         cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                familiar_id TEXT NOT NULL,
-                interaction_type TEXT NOT NULL,
-                emotions TEXT NOT NULL,
-                notes TEXT,
-                model_id TEXT
+        cur.execute(_CREATE_INTERACTIONS_TABLE)
+        cur.execute(_CREATE_RITUALS_TABLE)
+        _migrate_legacy_timestamps(conn)
+        if with_indexes:
+            # get_interactions/get_rituals filter on model_id plus a
+            # timestamp range; the composite index turns those full table
+            # scans into index range scans.
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS ix_interactions_model_ts"
+                " ON interactions(model_id, timestamp)"
             )
-            """
-        )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS rituals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                ritual_name TEXT NOT NULL,
-                success INTEGER NOT NULL,
-                outcome_description TEXT,
-                emotions TEXT NOT NULL,
-                notes TEXT,
-                model_id TEXT
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS ix_rituals_model_ts"
+                " ON rituals(model_id, timestamp)"
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS ix_rituals_name"
+                " ON rituals(ritual_name, model_id, timestamp)"
+            )
+            # Plain timestamp indexes serve pure range scans that do not
+            # filter on model_id.
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS ix_interactions_ts ON interactions(timestamp)"
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS ix_rituals_ts ON rituals(timestamp)"
             )
-            """
-        )
         conn.commit()
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_epoch(dt: datetime) -> int:
+    """Convert a datetime into unix microseconds for storage.
+
+    Naive datetimes are interpreted as UTC, matching the convention used
+    throughout the schemas.  An 8-byte integer column compares faster in
+    the B-tree and is roughly a third of the size of an ISO-8601 string.
+    The subtraction stays in exact integer arithmetic; going through
+    ``dt.timestamp()`` would round in float and truncate some
+    microsecond-precision values one low.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch(value) -> datetime:
+    """Convert a stored timestamp back into a naive UTC datetime.
+
+    Rows written before the switch to integer storage may still hold ISO
+    strings; those are parsed transparently.  A digit-only string means
+    an epoch value passed through a legacy TEXT-affinity column before
+    migration and is decoded as an integer, not ISO text.
+    """
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            return datetime.fromisoformat(value)
+    # Decode with the same integer arithmetic _to_epoch uses to encode;
+    # a float division here would drift for far-future timestamps and
+    # overflows outright on datetime.max.
+    return datetime(1970, 1, 1) + timedelta(microseconds=value)
+
+
+def _coerce_stored_timestamp(value) -> int:
+    """Normalise a timestamp read from a legacy table to epoch microseconds."""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return _to_epoch(datetime.fromisoformat(value))
+    return int(value)
+
+
 def _serialize_emotions(emotions: Sequence[EmotionIntensity]) -> str:
-    """Serialize a sequence of ``EmotionIntensity`` objects into a JSON string."""
-    return json.dumps([e.dict() for e in emotions], ensure_ascii=False)
+    """Serialize a sequence of ``EmotionIntensity`` objects into a JSON string.
+
+    The dicts are built directly from the two known fields rather than via
+    ``.dict()``, which would walk Pydantic's validation state per object.
+    """
+    return _json_dumps([{"name": e.name, "intensity": e.intensity} for e in emotions])
+
+
+@functools.lru_cache(maxsize=4096)
+def _emotion(name: str, intensity: float) -> EmotionIntensity:
+    """Return a shared ``EmotionIntensity`` for a (name, intensity) pair.
+
+    Emotion vocabularies are small and intensities tend to be quantized,
+    so large reads keep constructing the same values over and over.  The
+    cached instances are safe to share because the model is never mutated
+    after construction.
+    """
+    return EmotionIntensity.construct(name=name, intensity=intensity)
 
 
 def _deserialize_emotions(data: str) -> List[EmotionIntensity]:
-    """Deserialize a JSON string into a list of ``EmotionIntensity`` objects."""
+    """Deserialize a JSON string into a list of ``EmotionIntensity`` objects.
+
+    Values coming out of the database were validated before being written,
+    so ``construct`` is used (via :func:`_emotion`) to skip re-running the
+    Pydantic validators.
+    """
     if not data:
         return []
     try:
-        raw = json.loads(data)
+        raw = _json_loads(data)
     except Exception:
         return []
-    return [EmotionIntensity(**item) for item in raw]
+    return [_emotion(item["name"], item["intensity"]) for item in raw]
+
+
+# SQLite limits the number of bound parameters per statement; keeping batches
+# comfortably below that bound also keeps transaction memory predictable.
+_BULK_CHUNK_SIZE = 500
+
+# Module-level SQL constants: sqlite3's per-connection statement cache is
+# keyed on the exact string object, so passing the same constant on every
+# call lets the prepared program be reused instead of re-parsed.
+_INSERT_INTERACTION_SQL = (
+    "INSERT INTO interactions (timestamp, familiar_id, interaction_type, emotions, notes, model_id)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_RITUAL_SQL = (
+    "INSERT INTO rituals (timestamp, ritual_name, success, outcome_description, emotions, notes, model_id)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_SELECT_INTERACTIONS_SQL = (
+    "SELECT timestamp, familiar_id, interaction_type, emotions, notes, model_id"
+    " FROM interactions WHERE 1=1"
+)
+_SELECT_RITUALS_SQL = (
+    "SELECT timestamp, ritual_name, success, outcome_description, emotions, notes, model_id"
+    " FROM rituals WHERE 1=1"
+)
+
+
+def _interaction_from_row(row: Tuple) -> FamiliarInteraction:
+    """Build a ``FamiliarInteraction`` from a positionally unpacked row.
+
+    construct() skips validation; these rows were validated on write.
+    """
+    ts, familiar_id, interaction_type, emotions, notes, model_id = row
+    return FamiliarInteraction.construct(
+        timestamp=_from_epoch(ts),
+        familiar_id=familiar_id,
+        interaction_type=interaction_type,
+        emotions=_deserialize_emotions(emotions),
+        notes=notes,
+        model_id=model_id,
+    )
+
+
+def _ritual_from_row(row: Tuple) -> RitualOutcome:
+    """Build a ``RitualOutcome`` from a positionally unpacked row."""
+    ts, ritual_name, success, outcome_description, emotions, notes, model_id = row
+    return RitualOutcome.construct(
+        timestamp=_from_epoch(ts),
+        ritual_name=ritual_name,
+        success=bool(success),
+        outcome_description=outcome_description,
+        emotions=_deserialize_emotions(emotions),
+        notes=notes,
+        model_id=model_id,
+    )
+
+
+def _bulk_insert(sql: str, rows: List[Tuple], db_path: Optional[str]) -> List[int]:
+    """Insert ``rows`` using ``executemany`` inside a single transaction.
+
+    All rows are written under one ``BEGIN``/``COMMIT`` pair so that only a
+    single fsync is paid for the whole batch, instead of one per row.  Very
+    large batches are chunked to stay within SQLite's bound-parameter limits.
+
+    Returns
+    -------
+    List[int]
+        The IDs of the newly inserted rows, in input order.
+    """
+    if not rows:
+        return []
+    ids: List[int] = []
+    with write_connection(db_path) as conn:
+        # sqlite3.Connection is itself a context manager: it opens a
+        # transaction on first write and commits on clean exit (or rolls
+        # back on exception), all in C, so no explicit BEGIN/commit pair
+        # is needed here.
+        with conn:
+            cur = conn.cursor()
+            for i in range(0, len(rows), _BULK_CHUNK_SIZE):
+                chunk = rows[i : i + _BULK_CHUNK_SIZE]
+                cur.executemany(sql, chunk)
+                # AUTOINCREMENT ids are contiguous within a single
+                # transaction, so the chunk's ids can be recovered from
+                # the last rowid.
+                last = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+                ids.extend(range(last - len(chunk) + 1, last + 1))
+    return ids
+
+
+def add_interactions_bulk(
+    interactions: Sequence[FamiliarInteraction], db_path: Optional[str] = None
+) -> List[int]:
+    """Insert many familiar interactions in a single transaction.
+
+    Batching the inserts through ``executemany`` amortises the SQL parse and
+    the commit fsync across all rows, which makes bursty logging workloads
+    dramatically cheaper than calling :func:`add_interaction` per record.
+
+    Parameters
+    ----------
+    interactions : Sequence[FamiliarInteraction]
+        The interaction records to persist.
+    db_path : Optional[str]
+        Optional path to a specific database file.
+
+    Returns
+    -------
+    List[int]
+        The IDs of the newly inserted rows, in input order.
+    """
+    rows = [
+        (
+            _to_epoch(i.timestamp),
+            i.familiar_id,
+            i.interaction_type,
+            _serialize_emotions(i.emotions),
+            i.notes,
+            i.model_id,
+        )
+        for i in interactions
+    ]
+    return _bulk_insert(_INSERT_INTERACTION_SQL, rows, db_path)
+
+
+def add_rituals_bulk(
+    outcomes: Sequence[RitualOutcome], db_path: Optional[str] = None
+) -> List[int]:
+    """Insert many ritual outcomes in a single transaction.
+
+    See :func:`add_interactions_bulk` for the rationale behind batching.
+
+    Parameters
+    ----------
+    outcomes : Sequence[RitualOutcome]
+        The ritual outcomes to persist.
+    db_path : Optional[str]
+        Optional path to a specific database file.
+
+    Returns
+    -------
+    List[int]
+        The IDs of the newly inserted rows, in input order.
+    """
+    rows = [
+        (
+            _to_epoch(o.timestamp),
+            o.ritual_name,
+            1 if o.success else 0,
+            o.outcome_description,
+            _serialize_emotions(o.emotions),
+            o.notes,
+            o.model_id,
+        )
+        for o in outcomes
+    ]
+    return _bulk_insert(_INSERT_RITUAL_SQL, rows, db_path)
 
 
 def add_interaction(interaction: FamiliarInteraction, db_path: Optional[str] = None) -> int:
@@ -141,25 +685,7 @@ def add_interaction(interaction: FamiliarInteraction, db_path: Optional[str] = N
     int
         The ID of the newly inserted row.
     """
-    with get_connection(db_path) as conn:
-        cur = conn.cursor()
-        emotions_json = _serialize_emotions(interaction.emotions)
-        cur.execute(
-            """
-            INSERT INTO interactions (timestamp, familiar_id, interaction_type, emotions, notes, model_id)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                interaction.timestamp.isoformat(),
-                interaction.familiar_id,
-                interaction.interaction_type,
-                emotions_json,
-                interaction.notes,
-                interaction.model_id,
-            ),
-        )
-        conn.commit()
-        return cur.lastrowid
+    return add_interactions_bulk([interaction], db_path=db_path)[0]
 
 
 def add_ritual(outcome: RitualOutcome, db_path: Optional[str] = None) -> int:
@@ -177,37 +703,40 @@ def add_ritual(outcome: RitualOutcome, db_path: Optional[str] = None) -> int:
     int
         The ID of the newly inserted row.
     """
-    with get_connection(db_path) as conn:
-        cur = conn.cursor()
-        emotions_json = _serialize_emotions(outcome.emotions)
-        cur.execute(
-            """
-            INSERT INTO rituals (timestamp, ritual_name, success, outcome_description, emotions, notes, model_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                outcome.timestamp.isoformat(),
-                outcome.ritual_name,
-                1 if outcome.success else 0,
-                outcome.outcome_description,
-                emotions_json,
-                outcome.notes,
-                outcome.model_id,
-            ),
-        )
-        conn.commit()
-        return cur.lastrowid
+    return add_rituals_bulk([outcome], db_path=db_path)[0]
 
 
-def get_interactions(
+def _end_bound(end: Optional[datetime], end_exclusive: Optional[datetime]) -> Optional[int]:
+    """Return the exclusive upper epoch bound for a timestamp range.
+
+    Range predicates are always emitted as ``timestamp < ?`` half-open
+    comparisons, which the B-tree index can serve as a pure range scan.
+    An inclusive ``end`` is converted by bumping the bound one microsecond
+    past the stored resolution.
+    """
+    if end_exclusive is not None:
+        return _to_epoch(end_exclusive)
+    if end is not None:
+        return _to_epoch(end) + 1
+    return None
+
+
+def iter_interactions(
     model_id: Optional[str] = None,
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
+    end_exclusive: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
     db_path: Optional[str] = None,
-) -> List[FamiliarInteraction]:
-    """Retrieve familiar interactions from the database.
+) -> Iterable[FamiliarInteraction]:
+    """Stream familiar interactions from the database one at a time.
 
-    The caller can optionally filter by model identifier and/or a date range.
+    Unlike :func:`get_interactions`, records are decoded lazily straight
+    off the cursor, so memory use stays constant regardless of result
+    size and callers that stop early never pay for the remaining rows.
+    The underlying connection stays checked out of the pool until the
+    generator is exhausted or closed.
 
     Parameters
     ----------
@@ -219,94 +748,316 @@ def get_interactions(
     end : Optional[datetime]
         If provided, only records occurring on or before this timestamp will be
         returned.
+    end_exclusive : Optional[datetime]
+        Exclusive upper bound for the range.  Takes precedence over
+        ``end`` and maps directly onto the ``timestamp < ?`` predicate.
+    limit : Optional[int]
+        Maximum number of records to return, applied in SQL so excess
+        rows are never fetched or decoded.
+    offset : int
+        Number of records to skip before yielding, for pagination.
     db_path : Optional[str]
         Optional path to a specific database file.
 
-    Returns
-    -------
-    List[FamiliarInteraction]
-        A list of interaction records.
+    Notes
+    -----
+    Records are returned newest first.  The ``ORDER BY timestamp DESC``
+    is satisfied by the timestamp index, so a paginated request is a
+    short index scan rather than a full-table sort.
+
+    Yields
+    ------
+    FamiliarInteraction
+        Interaction records matching the filter criteria.
     """
-    query = "SELECT * FROM interactions WHERE 1=1"
+    # Project only the columns used below; the unused id column stays in
+    # SQLite and the tuples are unpacked positionally, skipping the
+    # per-field name lookup that sqlite3.Row performs.
+    query = _SELECT_INTERACTIONS_SQL
     params: List[object] = []
     if model_id is not None:
         query += " AND model_id = ?"
         params.append(model_id)
     if start is not None:
         query += " AND timestamp >= ?"
-        params.append(start.isoformat())
-    if end is not None:
-        query += " AND timestamp <= ?"
-        params.append(end.isoformat())
+        params.append(_to_epoch(start))
+    bound = _end_bound(end, end_exclusive)
+    if bound is not None:
+        query += " AND timestamp < ?"
+        params.append(bound)
+    query += " ORDER BY timestamp DESC"
+    if limit is not None or offset:
+        # SQLite requires a LIMIT clause to use OFFSET; -1 means unbounded.
+        query += " LIMIT ? OFFSET ?"
+        params.append(-1 if limit is None else limit)
+        params.append(offset)
     with get_connection(db_path) as conn:
-        cur = conn.cursor()
-        rows = cur.execute(query, params).fetchall()
-    interactions: List[FamiliarInteraction] = []
-    for row in rows:
-        emotions = _deserialize_emotions(row["emotions"])
-        interactions.append(
-            FamiliarInteraction(
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                familiar_id=row["familiar_id"],
-                interaction_type=row["interaction_type"],
-                emotions=emotions,
-                notes=row["notes"],
-                model_id=row["model_id"],
-            )
+        for row in _exec(conn, query, params):
+            yield _interaction_from_row(row)
+
+
+def get_interactions(
+    model_id: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    end_exclusive: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    db_path: Optional[str] = None,
+) -> List[FamiliarInteraction]:
+    """Retrieve familiar interactions from the database.
+
+    Thin materializing wrapper around :func:`iter_interactions`; see
+    there for the filter semantics.
+
+    Returns
+    -------
+    List[FamiliarInteraction]
+        A list of interaction records.
+    """
+    return list(
+        iter_interactions(
+            model_id=model_id,
+            start=start,
+            end=end,
+            end_exclusive=end_exclusive,
+            limit=limit,
+            offset=offset,
+            db_path=db_path,
         )
-    return interactions
+    )
 
 
-def get_rituals(
+def iter_rituals(
     model_id: Optional[str] = None,
+    ritual_name: Optional[str] = None,
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
+    end_exclusive: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
     db_path: Optional[str] = None,
-) -> List[RitualOutcome]:
-    """Retrieve ritual outcomes from the database with optional filtering.
+) -> Iterable[RitualOutcome]:
+    """Stream ritual outcomes from the database one at a time.
+
+    See :func:`iter_interactions` for the streaming semantics; the
+    connection stays checked out until the generator is exhausted or
+    closed.
 
     Parameters
     ----------
     model_id : Optional[str]
         Filter by originating model identifier.
+    ritual_name : Optional[str]
+        Filter by ritual name.  Pushing this predicate into SQL avoids
+        materializing rows that the caller would immediately discard.
     start : Optional[datetime]
         Return rituals occurring on or after this timestamp.
     end : Optional[datetime]
         Return rituals occurring on or before this timestamp.
+    end_exclusive : Optional[datetime]
+        Exclusive upper bound for the range; takes precedence over ``end``.
+    limit : Optional[int]
+        Maximum number of records to return, applied in SQL.
+    offset : int
+        Number of records to skip before yielding, for pagination.
     db_path : Optional[str]
         Path to a specific database file.
 
-    Returns
-    -------
-    List[RitualOutcome]
-        List of ritual outcome records.
+    Notes
+    -----
+    Records are returned newest first; see :func:`iter_interactions`.
+
+    Yields
+    ------
+    RitualOutcome
+        Ritual outcome records matching the filter criteria.
     """
-    query = "SELECT * FROM rituals WHERE 1=1"
+    query = _SELECT_RITUALS_SQL
     params: List[object] = []
     if model_id is not None:
         query += " AND model_id = ?"
         params.append(model_id)
+    if ritual_name is not None:
+        query += " AND ritual_name = ?"
+        params.append(ritual_name)
     if start is not None:
         query += " AND timestamp >= ?"
-        params.append(start.isoformat())
-    if end is not None:
-        query += " AND timestamp <= ?"
-        params.append(end.isoformat())
+        params.append(_to_epoch(start))
+    bound = _end_bound(end, end_exclusive)
+    if bound is not None:
+        query += " AND timestamp < ?"
+        params.append(bound)
+    query += " ORDER BY timestamp DESC"
+    if limit is not None or offset:
+        query += " LIMIT ? OFFSET ?"
+        params.append(-1 if limit is None else limit)
+        params.append(offset)
     with get_connection(db_path) as conn:
-        cur = conn.cursor()
-        rows = cur.execute(query, params).fetchall()
-    rituals: List[RitualOutcome] = []
-    for row in rows:
-        emotions = _deserialize_emotions(row["emotions"])
-        rituals.append(
-            RitualOutcome(
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                ritual_name=row["ritual_name"],
-                success=bool(row["success"]),
-                outcome_description=row["outcome_description"],
-                emotions=emotions,
-                notes=row["notes"],
-                model_id=row["model_id"],
-            )
+        for row in _exec(conn, query, params):
+            yield _ritual_from_row(row)
+
+
+def get_rituals(
+    model_id: Optional[str] = None,
+    ritual_name: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    end_exclusive: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    db_path: Optional[str] = None,
+) -> List[RitualOutcome]:
+    """Retrieve ritual outcomes from the database with optional filtering.
+
+    Thin materializing wrapper around :func:`iter_rituals`; see there for
+    the filter semantics.
+
+    Returns
+    -------
+    List[RitualOutcome]
+        List of ritual outcome records.
+    """
+    return list(
+        iter_rituals(
+            model_id=model_id,
+            ritual_name=ritual_name,
+            start=start,
+            end=end,
+            end_exclusive=end_exclusive,
+            limit=limit,
+            offset=offset,
+            db_path=db_path,
         )
-    return rituals
\ No newline at end of file
+    )
+
+
+def get_interactions_and_rituals(
+    db_path: Optional[str] = None,
+) -> Tuple[List[FamiliarInteraction], List[RitualOutcome]]:
+    """Fetch all interactions and all rituals over a single connection.
+
+    Callers that need both tables (insight generation, cross-model
+    aggregation) previously paid two connection checkouts and two
+    transactions; running both SELECTs back-to-back on one connection
+    halves that overhead and keeps the page cache warm between the scans.
+
+    Returns
+    -------
+    Tuple[List[FamiliarInteraction], List[RitualOutcome]]
+        All interaction records and all ritual outcome records.
+    """
+    with get_connection(db_path) as conn:
+        interactions = [_interaction_from_row(row) for row in _exec(conn, _SELECT_INTERACTIONS_SQL)]
+        rituals = [_ritual_from_row(row) for row in _exec(conn, _SELECT_RITUALS_SQL)]
+    return interactions, rituals
+
+
+def aggregate_emotion_counts(db_path: Optional[str] = None) -> Dict[str, int]:
+    """Count occurrences of each emotion entirely inside SQLite.
+
+    This is the SQL counterpart of ``patterns.aggregate_emotion_counts``:
+    the emotions JSON is expanded with ``json_each`` and grouped in a
+    single C-level scan, so no rows are materialized in Python.  Prefer
+    this when aggregating over the whole database; the Python version in
+    ``patterns`` remains for callers that already hold record lists.
+
+    Returns
+    -------
+    Dict[str, int]
+        Mapping of emotion names to their total occurrence count.
+    """
+    with get_connection(db_path) as conn:
+        rows = _exec(
+            conn,
+            """
+            SELECT emotion, COUNT(*) AS n FROM (
+                SELECT json_extract(je.value, '$.name') AS emotion
+                FROM interactions, json_each(interactions.emotions) AS je
+                UNION ALL
+                SELECT json_extract(je.value, '$.name')
+                FROM rituals, json_each(rituals.emotions) AS je
+            )
+            GROUP BY emotion
+            """
+        ).fetchall()
+    return {row[0]: row[1] for row in rows}
+
+
+def compute_success_rate(db_path: Optional[str] = None) -> float:
+    """Compute the overall ritual success rate inside SQLite.
+
+    SQL counterpart of ``patterns.compute_success_rate``.  Returns 0.0
+    when no rituals are recorded.
+    """
+    with get_connection(db_path) as conn:
+        rate = _exec(conn, "SELECT AVG(success) FROM rituals").fetchone()[0]
+    return rate if rate is not None else 0.0
+
+
+def get_ritual_names(db_path: Optional[str] = None) -> List[str]:
+    """Return the name of every logged ritual, one entry per row.
+
+    Supports SQL-side insight generation: the names are the only piece
+    of per-ritual data the insights need that the aggregate queries do
+    not already produce.
+    """
+    with get_connection(db_path) as conn:
+        return [row[0] for row in _exec(conn, "SELECT ritual_name FROM rituals")]
+
+
+def emotion_counts_by_model(db_path: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+    """Aggregate emotion counts per model identifier inside SQLite.
+
+    SQL counterpart of ``patterns.emotion_counts_by_model``.  Records
+    without a ``model_id`` are grouped under ``"unknown"``.
+
+    Returns
+    -------
+    Dict[str, Dict[str, int]]
+        Nested mapping of ``model_id`` to emotion names to counts.
+    """
+    with get_connection(db_path) as conn:
+        rows = _exec(
+            conn,
+            """
+            SELECT model, emotion, COUNT(*) AS n FROM (
+                SELECT COALESCE(model_id, 'unknown') AS model,
+                       json_extract(je.value, '$.name') AS emotion
+                FROM interactions, json_each(interactions.emotions) AS je
+                UNION ALL
+                SELECT COALESCE(model_id, 'unknown'),
+                       json_extract(je.value, '$.name')
+                FROM rituals, json_each(rituals.emotions) AS je
+            )
+            GROUP BY model, emotion
+            """
+        ).fetchall()
+    result: Dict[str, Dict[str, int]] = {}
+    for model, emotion, count in rows:
+        result.setdefault(model, {})[emotion] = count
+    return result
+
+
+def ritual_success_by_emotion(db_path: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
+    """Compute ritual success/failure counts per emotion inside SQLite.
+
+    SQL counterpart of ``patterns.ritual_success_by_emotion``.
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        Mapping of emotion names to a tuple (success_count, failure_count).
+    """
+    with get_connection(db_path) as conn:
+        rows = _exec(
+            conn,
+            """
+            SELECT json_extract(je.value, '$.name') AS emotion,
+                   SUM(success) AS successes,
+                   SUM(1 - success) AS failures
+            FROM rituals, json_each(rituals.emotions) AS je
+            GROUP BY emotion
+            """
+        ).fetchall()
+    return {row[0]: (row[1], row[2]) for row in rows}
@@ -10,12 +10,67 @@ and they provide a foundation for more advanced machine learning models.
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Tuple
 
 from .schemas import EmotionIntensity, FamiliarInteraction, PatternInsight, RitualOutcome
 
 
+@dataclass
+class _InteractionScan:
+    """Counters accumulated in a single pass over interactions."""
+
+    emotion_counts: Counter = field(default_factory=Counter)
+    model_emotion_counts: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class _RitualScan:
+    """Counters accumulated in a single pass over rituals."""
+
+    emotion_counts: Counter = field(default_factory=Counter)
+    model_emotion_counts: Counter = field(default_factory=Counter)
+    success_by_emotion: Dict[str, List[int]] = field(default_factory=dict)
+    total: int = 0
+    successes: int = 0
+    ritual_names: List[str] = field(default_factory=list)
+
+
+def _scan_interactions(interactions: Iterable[FamiliarInteraction]) -> _InteractionScan:
+    """Collect every interaction statistic needed by ``generate_insights``."""
+    scan = _InteractionScan()
+    for inter in interactions:
+        key = inter.model_id or "unknown"
+        for e in inter.emotions:
+            scan.emotion_counts[e.name] += 1
+            scan.model_emotion_counts[(key, e.name)] += 1
+    return scan
+
+
+def _scan_rituals(rituals: Iterable[RitualOutcome]) -> _RitualScan:
+    """Collect every ritual statistic needed by ``generate_insights``.
+
+    A single traversal maintains all counters simultaneously, so the
+    attribute access and emotion-list iteration per ritual are paid once
+    instead of once per downstream aggregate.
+    """
+    scan = _RitualScan()
+    for r in rituals:
+        scan.total += 1
+        if r.success:
+            scan.successes += 1
+        scan.ritual_names.append(r.ritual_name)
+        key = r.model_id or "unknown"
+        slot = 0 if r.success else 1
+        for e in r.emotions:
+            scan.emotion_counts[e.name] += 1
+            scan.model_emotion_counts[(key, e.name)] += 1
+            scan.success_by_emotion.setdefault(e.name, [0, 0])[slot] += 1
+    return scan
+
+
 def aggregate_emotion_counts(
     interactions: Iterable[FamiliarInteraction], rituals: Iterable[RitualOutcome]
 ) -> Dict[str, int]:
@@ -33,13 +88,11 @@ def aggregate_emotion_counts(
     Dict[str, int]
         Mapping of emotion names to their total occurrence count.
     """
+    # Counter.update consumes the generator in C, which is markedly faster
+    # than incrementing counter[e.name] item by item in Python.
     counter: Counter[str] = Counter()
-    for inter in interactions:
-        for e in inter.emotions:
-            counter[e.name] += 1
-    for rit in rituals:
-        for e in rit.emotions:
-            counter[e.name] += 1
+    counter.update(e.name for inter in interactions for e in inter.emotions)
+    counter.update(e.name for rit in rituals for e in rit.emotions)
     return dict(counter)
 
 
@@ -85,17 +138,18 @@ def emotion_counts_by_model(
         to counts.  Interactions and rituals without a ``model_id`` are
         aggregated under the key ``"unknown"``.
     """
-    result: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    for inter in interactions:
-        key = inter.model_id or "unknown"
-        for e in inter.emotions:
-            result[key][e.name] += 1
-    for rit in rituals:
-        key = rit.model_id or "unknown"
-        for e in rit.emotions:
-            result[key][e.name] += 1
-    # Convert defaultdicts to ordinary dicts
-    return {k: dict(v) for k, v in result.items()}
+    # A single Counter keyed on (model, emotion) avoids the nested
+    # defaultdict factories and the final per-inner-dict rebuild pass; the
+    # flat counts are pivoted into the nested shape at the end.
+    flat: Counter = Counter()
+    flat.update(
+        (inter.model_id or "unknown", e.name) for inter in interactions for e in inter.emotions
+    )
+    flat.update((rit.model_id or "unknown", e.name) for rit in rituals for e in rit.emotions)
+    result: Dict[str, Dict[str, int]] = {}
+    for (model, name), count in flat.items():
+        result.setdefault(model, {})[name] = count
+    return result
 
 
 def ritual_success_by_emotion(
@@ -117,14 +171,15 @@ def ritual_success_by_emotion(
     Dict[str, Tuple[int, int]]
         Mapping of emotion names to a tuple (success_count, failure_count).
     """
-    stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    successes: Counter = Counter()
+    failures: Counter = Counter()
     for r in rituals:
-        for e in r.emotions:
-            if r.success:
-                stats[e.name][0] += 1
-            else:
-                stats[e.name][1] += 1
-    return {name: (counts[0], counts[1]) for name, counts in stats.items()}
+        target = successes if r.success else failures
+        target.update(e.name for e in r.emotions)
+    return {
+        name: (successes[name], failures[name])
+        for name in successes.keys() | failures.keys()
+    }
 
 
 def generate_insights(
@@ -145,6 +200,58 @@ def generate_insights(
     rituals : List[RitualOutcome]
         All recorded ritual outcomes.
 
+    Returns
+    -------
+    List[PatternInsight]
+        A list of insights ordered by significance (heuristically defined).
+    """
+    # One pass over each list collects every statistic needed below,
+    # instead of re-traversing the data for each aggregate.
+    inter_scan = _scan_interactions(interactions)
+    rit_scan = _scan_rituals(rituals)
+
+    emotion_counts = dict(inter_scan.emotion_counts + rit_scan.emotion_counts)
+    success_rate = rit_scan.successes / rit_scan.total if rit_scan.total > 0 else 0.0
+    by_model: Dict[str, Dict[str, int]] = {}
+    for (model, name), count in (
+        inter_scan.model_emotion_counts + rit_scan.model_emotion_counts
+    ).items():
+        by_model.setdefault(model, {})[name] = count
+    success_by_emotion = {
+        name: (counts[0], counts[1]) for name, counts in rit_scan.success_by_emotion.items()
+    }
+    return insights_from_aggregates(
+        emotion_counts, success_rate, rit_scan.ritual_names, by_model, success_by_emotion
+    )
+
+
+def insights_from_aggregates(
+    emotion_counts: Dict[str, int],
+    success_rate: float,
+    ritual_names: List[str],
+    by_model: Dict[str, Dict[str, int]],
+    success_by_emotion: Dict[str, Tuple[int, int]],
+) -> List[PatternInsight]:
+    """Build the insight list from pre-computed aggregates.
+
+    Callers holding record lists should use :func:`generate_insights`,
+    which derives these aggregates in a single pass.  This entry point
+    exists so the MCP server can feed in the results of the SQL-side
+    aggregate queries in ``db`` without materializing any rows.
+
+    Parameters
+    ----------
+    emotion_counts : Dict[str, int]
+        Total occurrences per emotion across interactions and rituals.
+    success_rate : float
+        Fraction of rituals marked successful, 0.0 when none exist.
+    ritual_names : List[str]
+        Name of every logged ritual, one entry per ritual.
+    by_model : Dict[str, Dict[str, int]]
+        Emotion counts nested under each model identifier.
+    success_by_emotion : Dict[str, Tuple[int, int]]
+        Per-emotion (success_count, failure_count) pairs over rituals.
+
     Returns
     -------
     List[PatternInsight]
@@ -153,10 +260,9 @@ def generate_insights(
     insights: List[PatternInsight] = []
 
     # Overall emotion frequency
-    emotion_counts = aggregate_emotion_counts(interactions, rituals)
     if emotion_counts:
-        # Sort emotions by count descending and pick top 3
-        top_emotions = sorted(emotion_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        # nlargest is O(N log 3) and avoids allocating a fully sorted list
+        top_emotions = heapq.nlargest(3, emotion_counts.items(), key=lambda x: x[1])
         description = (
             "The most frequently experienced emotions across all interactions and rituals "
             f"are: {', '.join([f'{name} ({count})' for name, count in top_emotions])}."
@@ -172,19 +278,18 @@ def generate_insights(
         )
 
     # Ritual success rate
-    success_rate = compute_success_rate(rituals)
-    description = f"Overall ritual success rate is {success_rate * 100:.1f}% across {len(rituals)} rituals."
-    metrics = {"success_rate": success_rate, "ritual_count": float(len(rituals))}
+    ritual_count = len(ritual_names)
+    description = f"Overall ritual success rate is {success_rate * 100:.1f}% across {ritual_count} rituals."
+    metrics = {"success_rate": success_rate, "ritual_count": float(ritual_count)}
     insights.append(
         PatternInsight(
             description=description,
             metrics=metrics,
-            related_entities={"rituals": [r.ritual_name for r in rituals]},
+            related_entities={"rituals": ritual_names},
         )
     )
 
     # Emotion by model
-    by_model = emotion_counts_by_model(interactions, rituals)
     if len(by_model) > 1:
         # Identify the model with the most distinct emotional palette (most unique emotions)
         model_stats = {model: len(counts) for model, counts in by_model.items()}
@@ -202,20 +307,24 @@ def generate_insights(
         )
 
     # Success by emotion
-    success_by_emotion = ritual_success_by_emotion(rituals)
     if success_by_emotion:
-        # Find emotions most associated with successful rituals
-        success_ratio = {
-            name: (succ / (succ + fail)) if (succ + fail) > 0 else 0.0
-            for name, (succ, fail) in success_by_emotion.items()
-        }
-        top_positive = sorted(success_ratio.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Find emotions most associated with successful rituals.  The
+        # ratio is evaluated inside the heap key, so only the top-3
+        # winners are ever materialized instead of a full ratio dict.
+        def ratio(item: Tuple[str, Tuple[int, int]]) -> float:
+            succ, fail = item[1]
+            return succ / (succ + fail) if (succ + fail) > 0 else 0.0
+
+        top_positive = [
+            (name, ratio((name, counts)))
+            for name, counts in heapq.nlargest(3, success_by_emotion.items(), key=ratio)
+        ]
         description = (
             "Emotions most correlated with successful rituals: "
-            + ", ".join([f"{name} ({ratio*100:.0f}%)" for name, ratio in top_positive])
+            + ", ".join([f"{name} ({r*100:.0f}%)" for name, r in top_positive])
             + "."
         )
-        metrics = {name: ratio for name, ratio in success_ratio.items()}
+        metrics = {name: r for name, r in top_positive}
         related_entities = {"emotions": [name for name, _ in top_positive]}
         insights.append(
             PatternInsight(
@@ -0,0 +1,100 @@
+"""Optional Numba-accelerated kernels for pattern recognition.
+
+For modest databases the pure-Python aggregations in ``patterns.py`` are
+perfectly adequate.  Once ritual logs grow into the millions of rows the
+double loop in ``ritual_success_by_emotion`` — with its per-event dict
+lookups and boxed integers — becomes the bottleneck.  This module packs
+the ritual data into flat numpy arrays (a CSR-style layout of emotion ids
+per ritual) and processes them with a compiled kernel, falling back to
+the Python implementation when numba or numpy is not installed.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Tuple
+
+from . import patterns
+from .schemas import RitualOutcome
+
+try:
+    import numba
+    import numpy as np
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAVE_NUMBA = False
+
+# Below this many rituals the array packing plus kernel dispatch costs
+# more than the pure-Python Counter pass it replaces.
+_MIN_KERNEL_ROWS = 2048
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(cache=True)
+    def _succ_fail(success, emo_flat, offsets, n_emotions):  # pragma: no cover
+        """Accumulate success/failure counts per emotion id over a CSR layout.
+
+        ``emo_flat[offsets[i]:offsets[i+1]]`` holds the emotion ids of
+        ritual ``i``; ``success[i]`` is its outcome.  The loop runs as
+        native code with two unboxed int64 accumulators per emotion.
+        """
+        succ = np.zeros(n_emotions, np.int64)
+        fail = np.zeros(n_emotions, np.int64)
+        for i in range(success.size):
+            for j in range(offsets[i], offsets[i + 1]):
+                e = emo_flat[j]
+                if success[i]:
+                    succ[e] += 1
+                else:
+                    fail[e] += 1
+        return succ, fail
+
+
+def ritual_success_by_emotion(
+    rituals: Iterable[RitualOutcome],
+) -> Dict[str, Tuple[int, int]]:
+    """Compute success counts of rituals conditioned on each emotion.
+
+    Drop-in replacement for ``patterns.ritual_success_by_emotion`` that
+    dispatches to a compiled kernel when numba is available and the input
+    is large enough to amortize the array packing; otherwise it falls
+    back to the Python implementation.
+
+    Parameters
+    ----------
+    rituals : Iterable[RitualOutcome]
+        Sequence of ritual outcome records.
+
+    Returns
+    -------
+    Dict[str, Tuple[int, int]]
+        Mapping of emotion names to a tuple (success_count, failure_count).
+    """
+    if not HAVE_NUMBA:
+        return patterns.ritual_success_by_emotion(rituals)
+
+    rituals = list(rituals)
+    if len(rituals) < _MIN_KERNEL_ROWS:
+        return patterns.ritual_success_by_emotion(rituals)
+    # Intern emotion names to dense int ids while flattening the per-ritual
+    # emotion lists into one array with CSR-style row offsets.
+    emotion_ids: Dict[str, int] = {}
+    flat: list = []
+    success = np.empty(len(rituals), np.bool_)
+    offsets = np.empty(len(rituals) + 1, np.int64)
+    offsets[0] = 0
+    for i, r in enumerate(rituals):
+        success[i] = r.success
+        for e in r.emotions:
+            eid = emotion_ids.get(e.name)
+            if eid is None:
+                eid = len(emotion_ids)
+                emotion_ids[e.name] = eid
+            flat.append(eid)
+        offsets[i + 1] = len(flat)
+    if not emotion_ids:
+        return {}
+    emo_flat = np.asarray(flat, np.int32)
+    succ, fail = _succ_fail(success, emo_flat, offsets, len(emotion_ids))
+    return {name: (int(succ[eid]), int(fail[eid])) for name, eid in emotion_ids.items()}
@@ -10,13 +10,64 @@ the MCP SDK.
 
 from __future__ import annotations
 
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from typing import List, Optional, Literal
 
+from pydantic import VERSION as _PYDANTIC_VERSION
 from pydantic import BaseModel, Field, validator
 
+try:
+    import orjson
 
-class EmotionIntensity(BaseModel):
+    def _json_dumps(value, *, default) -> str:
+        # orjson serializes datetimes and nested lists in C; pydantic
+        # expects a str back, so the bytes are decoded here.
+        return orjson.dumps(value, default=default).decode()
+
+except ImportError:  # pragma: no cover
+    _json_dumps = json.dumps
+
+
+class SanctuaryModel(BaseModel):
+    """Shared base for all bridge schemas.
+
+    Under pydantic v1 this routes ``.json()`` through ``orjson`` when it
+    is installed, which dominates the cost of serializing large resource
+    responses; otherwise the stdlib encoder is used.  Pydantic v2
+    removed the ``json_dumps`` hook (setting it only emits a warning)
+    and already serializes in compiled code, so the config is applied on
+    v1 only.
+    """
+
+    if _PYDANTIC_VERSION.startswith("1"):
+
+        class Config:
+            json_dumps = _json_dumps
+
+
+def _coerce_timestamp(value):
+    """Coerce an incoming timestamp value into a ``datetime``.
+
+    The common case — a ``datetime`` that is simply passed through, as
+    happens for every row built by the DB layer — is checked first with an
+    exact class compare, which is a pointer comparison rather than the
+    full ``isinstance`` protocol.  ISO strings and numeric epochs sent by
+    MCP clients take the slower branches.
+    """
+    if value.__class__ is datetime:
+        return value
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if isinstance(value, (int, float)):
+        # fromtimestamp with an explicit zone replaces the deprecated
+        # utcfromtimestamp; tzinfo is stripped to keep the naive-UTC
+        # convention used throughout the stored data.
+        return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class EmotionIntensity(SanctuaryModel):
     """Represents a single emotional state with an associated intensity.
 
     Attributes
@@ -32,7 +83,7 @@ class EmotionIntensity(BaseModel):
     intensity: float = Field(..., ge=0.0, le=1.0, description="Intensity on a 0–1 scale")
 
 
-class FamiliarInteraction(BaseModel):
+class FamiliarInteraction(SanctuaryModel):
     """A log entry representing a familiar interaction.
 
     Familiar interactions are one of the core building blocks of the
@@ -78,14 +129,10 @@ class FamiliarInteraction(BaseModel):
         MCP clients may send timestamps as ISO8601 strings.  This validator
         ensures that such strings are converted to ``datetime`` objects.
         """
-        if isinstance(value, (int, float)):
-            return datetime.utcfromtimestamp(value)
-        if isinstance(value, str):
-            return datetime.fromisoformat(value)
-        return value
+        return _coerce_timestamp(value)
 
 
-class RitualOutcome(BaseModel):
+class RitualOutcome(SanctuaryModel):
     """A log entry representing the outcome of a ritual.
 
     Rituals are intentional ceremonies or practices performed within the
@@ -122,14 +169,10 @@ class RitualOutcome(BaseModel):
 
     @validator("timestamp", pre=True)
     def parse_timestamp(cls, value):
-        if isinstance(value, (int, float)):
-            return datetime.utcfromtimestamp(value)
-        if isinstance(value, str):
-            return datetime.fromisoformat(value)
-        return value
+        return _coerce_timestamp(value)
 
 
-class PatternInsight(BaseModel):
+class PatternInsight(SanctuaryModel):
     """Represents an aggregated insight or pattern discovered from logged data.
 
     When analysing interactions and rituals, the pattern recognition module
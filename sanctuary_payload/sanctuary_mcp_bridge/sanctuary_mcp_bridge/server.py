@@ -22,8 +22,13 @@ also embed the server into an existing application by calling
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
-from typing import List, Optional
+import functools
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+
+UTC = timezone.utc
 
 try:
     from mcp.server.fastmcp import FastMCP
@@ -37,9 +42,69 @@ from . import db, patterns
 from .schemas import FamiliarInteraction, RitualOutcome, PatternInsight, EmotionIntensity
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, caching recently seen strings.
+
+    MCP clients tend to resend the same window boundaries (for example
+    "today at midnight") across many calls, so the cache turns most
+    parses into a dict lookup.  Safe because ``datetime`` is immutable.
+    """
+    return datetime.fromisoformat(value)
+
+
+# Aggregates such as insights are recomputed from the full tables, yet
+# dashboards poll them far more often than new rows arrive.  Results are
+# cached keyed on the tables' max rowids, which only move when data is
+# appended, so a cache hit costs two MAX(id) probes instead of two scans.
+_AGGREGATE_CACHE: "OrderedDict[tuple, object]" = OrderedDict()
+_AGGREGATE_CACHE_LOCK = threading.Lock()
+_AGGREGATE_CACHE_SIZE = 32
+
+
+def _tables_version(db_path: Optional[str]) -> Tuple[int, int]:
+    """Return a cheap change marker for the interactions/rituals tables."""
+    with db.get_connection(db_path) as conn:
+        return (
+            conn.execute("SELECT COALESCE(MAX(id), 0) FROM interactions").fetchone()[0],
+            conn.execute("SELECT COALESCE(MAX(id), 0) FROM rituals").fetchone()[0],
+        )
+
+
+async def _cached_aggregate(kind: str, db_path: Optional[str], compute: Callable[[], object]) -> object:
+    """Serve ``compute()`` results from the LRU cache while data is unchanged.
+
+    ``compute`` is awaited so handlers can overlap their blocking reads
+    on worker threads; the version probe itself is pushed off the event
+    loop for the same reason.
+    """
+    key = (kind, db_path) + await asyncio.to_thread(_tables_version, db_path)
+    with _AGGREGATE_CACHE_LOCK:
+        if key in _AGGREGATE_CACHE:
+            _AGGREGATE_CACHE.move_to_end(key)
+            return _AGGREGATE_CACHE[key]
+    value = await compute()
+    with _AGGREGATE_CACHE_LOCK:
+        _AGGREGATE_CACHE[key] = value
+        _AGGREGATE_CACHE.move_to_end(key)
+        while len(_AGGREGATE_CACHE) > _AGGREGATE_CACHE_SIZE:
+            _AGGREGATE_CACHE.popitem(last=False)
+    return value
+
+
+# Database paths whose schema has already been verified in this process;
+# init_db is idempotent but there is no need to re-issue the DDL per server.
+_INITIALIZED: set = set()
+
+
+@functools.lru_cache(maxsize=8)
 def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
     """Create and configure a FastMCP server for the Sanctuary bridge.
 
+    The server is memoized per ``db_path``, so repeated construction
+    (reloads, tests, multi-tenant embeds) returns the existing instance
+    instead of re-registering every resource and tool.
+
     Parameters
     ----------
     db_path : Optional[str]
@@ -51,11 +116,29 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
     FastMCP
         Configured MCP server with registered resources and tools.
     """
-    # Ensure the database exists
-    db.init_db(db_path)
+    # Ensure the database exists (once per path per process)
+    if db_path not in _INITIALIZED:
+        db.init_db(db_path)
+        db.init_pools(db_path)
+        _INITIALIZED.add(db_path)
 
     mcp = FastMCP(name="Sanctuary MCP Bridge", version="0.1.0")
 
+    # Specialize the db layer for this server's path once at construction;
+    # handlers then invoke the pre-bound callables instead of re-forming
+    # the db_path keyword on every call.
+    _get_interactions = functools.partial(db.get_interactions, db_path=db_path)
+    _get_rituals = functools.partial(db.get_rituals, db_path=db_path)
+    _add_interaction = functools.partial(db.add_interaction, db_path=db_path)
+    _add_ritual = functools.partial(db.add_ritual, db_path=db_path)
+    _add_interactions_bulk = functools.partial(db.add_interactions_bulk, db_path=db_path)
+    _add_rituals_bulk = functools.partial(db.add_rituals_bulk, db_path=db_path)
+    _emotion_counts_by_model = functools.partial(db.emotion_counts_by_model, db_path=db_path)
+    _aggregate_emotion_counts = functools.partial(db.aggregate_emotion_counts, db_path=db_path)
+    _compute_success_rate = functools.partial(db.compute_success_rate, db_path=db_path)
+    _ritual_success_by_emotion = functools.partial(db.ritual_success_by_emotion, db_path=db_path)
+    _get_ritual_names = functools.partial(db.get_ritual_names, db_path=db_path)
+
     # ---- Resources ----
 
     @mcp.resource("sanctuary://interactions")
@@ -63,8 +146,10 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
         model_id: Optional[str] = None,
         start: Optional[str] = None,
         end: Optional[str] = None,
+        limit: Optional[int] = 500,
+        offset: int = 0,
     ) -> List[FamiliarInteraction]:
-        """Fetch logged familiar interactions.
+        """Fetch logged familiar interactions, newest first.
 
         Parameters
         ----------
@@ -74,24 +159,35 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
             ISO‑8601 timestamp specifying the inclusive start of the range.
         end : Optional[str]
             ISO‑8601 timestamp specifying the inclusive end of the range.
+        limit : Optional[int]
+            Maximum number of records to return; applied in SQL so a
+            large table never overwhelms the MCP transport.  Defaults to
+            500; pass ``None`` explicitly to fetch everything.
+        offset : int
+            Number of records to skip, for paging through older entries.
 
         Returns
         -------
         List[FamiliarInteraction]
             A list of interactions matching the filter criteria.
         """
-        start_dt = datetime.fromisoformat(start) if start else None
-        end_dt = datetime.fromisoformat(end) if end else None
-        interactions = db.get_interactions(model_id=model_id, start=start_dt, end=end_dt, db_path=db_path)
-        return interactions
+        start_dt = _parse_iso(start) if start else None
+        # Inclusive end becomes an exclusive bound so the DB layer can use
+        # an index-friendly half-open range predicate.
+        end_excl = _parse_iso(end) + timedelta(microseconds=1) if end else None
+        return _get_interactions(
+            model_id=model_id, start=start_dt, end_exclusive=end_excl, limit=limit, offset=offset
+        )
 
     @mcp.resource("sanctuary://rituals")
     def get_rituals(
         model_id: Optional[str] = None,
         start: Optional[str] = None,
         end: Optional[str] = None,
+        limit: Optional[int] = 500,
+        offset: int = 0,
     ) -> List[RitualOutcome]:
-        """Fetch logged ritual outcomes.
+        """Fetch logged ritual outcomes, newest first.
 
         Parameters
         ----------
@@ -101,17 +197,43 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
             Inclusive start timestamp in ISO‑8601 format.
         end : Optional[str]
             Inclusive end timestamp in ISO‑8601 format.
+        limit : Optional[int]
+            Maximum number of records to return, applied in SQL.
+            Defaults to 500; pass ``None`` to fetch everything.
+        offset : int
+            Number of records to skip, for paging through older entries.
         """
-        start_dt = datetime.fromisoformat(start) if start else None
-        end_dt = datetime.fromisoformat(end) if end else None
-        return db.get_rituals(model_id=model_id, start=start_dt, end=end_dt, db_path=db_path)
+        start_dt = _parse_iso(start) if start else None
+        end_excl = _parse_iso(end) + timedelta(microseconds=1) if end else None
+        return _get_rituals(
+            model_id=model_id, start=start_dt, end_exclusive=end_excl, limit=limit, offset=offset
+        )
 
     @mcp.resource("sanctuary://insights")
-    def get_insights() -> List[PatternInsight]:
+    async def get_insights() -> List[PatternInsight]:
         """Return aggregated pattern insights from all data."""
-        interactions = db.get_interactions(db_path=db_path)
-        rituals = db.get_rituals(db_path=db_path)
-        return patterns.generate_insights(interactions, rituals)
+        async def compute() -> List[PatternInsight]:
+            # Every aggregate runs inside SQLite on its own pooled
+            # connection — overlapping under WAL — so no rows are
+            # materialized as Pydantic models just to be counted.
+            (
+                emotion_counts,
+                success_rate,
+                ritual_names,
+                by_model,
+                success_by_emotion,
+            ) = await asyncio.gather(
+                asyncio.to_thread(_aggregate_emotion_counts),
+                asyncio.to_thread(_compute_success_rate),
+                asyncio.to_thread(_get_ritual_names),
+                asyncio.to_thread(_emotion_counts_by_model),
+                asyncio.to_thread(_ritual_success_by_emotion),
+            )
+            return patterns.insights_from_aggregates(
+                emotion_counts, success_rate, ritual_names, by_model, success_by_emotion
+            )
+
+        return await _cached_aggregate("insights", db_path, compute)
 
     # ---- Tools ----
 
@@ -147,7 +269,7 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
         int
             The database ID of the newly inserted interaction.
         """
-        ts = datetime.fromisoformat(timestamp) if timestamp else datetime.utcnow()
+        ts = _parse_iso(timestamp) if timestamp else datetime.now(UTC)
         interaction = FamiliarInteraction(
             timestamp=ts,
             familiar_id=familiar_id,
@@ -156,7 +278,7 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
             notes=notes,
             model_id=model_id,
         )
-        return db.add_interaction(interaction, db_path=db_path)
+        return _add_interaction(interaction)
 
     @mcp.tool()
     def log_ritual(
@@ -192,7 +314,7 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
         int
             Database ID of the newly inserted ritual.
         """
-        ts = datetime.fromisoformat(timestamp) if timestamp else datetime.utcnow()
+        ts = _parse_iso(timestamp) if timestamp else datetime.now(UTC)
         outcome = RitualOutcome(
             timestamp=ts,
             ritual_name=ritual_name,
@@ -202,14 +324,58 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
             notes=notes,
             model_id=model_id,
         )
-        return db.add_ritual(outcome, db_path=db_path)
+        return _add_ritual(outcome)
+
+    @mcp.tool()
+    def log_interactions_bulk(items: List[FamiliarInteraction]) -> List[int]:
+        """Record many familiar interactions in a single transaction.
+
+        Clients with bursty logging workloads should prefer this over
+        repeated ``log_interaction`` calls: all rows are written under
+        one commit, amortizing the transaction and fsync cost across the
+        batch.
+
+        Parameters
+        ----------
+        items : List[FamiliarInteraction]
+            The interaction records to persist.
+
+        Returns
+        -------
+        List[int]
+            Database IDs of the newly inserted interactions, in input order.
+        """
+        return _add_interactions_bulk(items)
 
     @mcp.tool()
-    def query_emotions_by_model() -> dict[str, dict[str, int]]:
+    def log_rituals_bulk(items: List[RitualOutcome]) -> List[int]:
+        """Record many ritual outcomes in a single transaction.
+
+        See ``log_interactions_bulk`` for the batching rationale.
+
+        Parameters
+        ----------
+        items : List[RitualOutcome]
+            The ritual outcomes to persist.
+
+        Returns
+        -------
+        List[int]
+            Database IDs of the newly inserted rituals, in input order.
+        """
+        return _add_rituals_bulk(items)
+
+    @mcp.tool()
+    async def query_emotions_by_model() -> dict[str, dict[str, int]]:
         """Return emotion counts grouped by model identifier."""
-        interactions = db.get_interactions(db_path=db_path)
-        rituals = db.get_rituals(db_path=db_path)
-        return patterns.emotion_counts_by_model(interactions, rituals)
+        path = db_path
+
+        async def compute() -> dict[str, dict[str, int]]:
+            # The GROUP BY runs inside SQLite; no rows are materialized
+            # as Pydantic objects just to be counted.
+            return await asyncio.to_thread(_emotion_counts_by_model)
+
+        return await _cached_aggregate("emotions_by_model", path, compute)
 
     @mcp.tool()
     def query_ritual_insights(
@@ -232,12 +398,8 @@ def create_mcp_server(db_path: Optional[str] = None) -> FastMCP:
             Insights derived from the subset of rituals.  If no matching
             records are found, an empty list is returned.
         """
-        # Filter rituals by name and model
-        rituals = [
-            r
-            for r in db.get_rituals(model_id=model_id, db_path=db_path)
-            if r.ritual_name == ritual_name
-        ]
+        # The name filter runs in SQL, so only matching rows are decoded
+        rituals = _get_rituals(model_id=model_id, ritual_name=ritual_name)
         if not rituals:
             return []
         # Interactions are not relevant for ritual‑specific insights